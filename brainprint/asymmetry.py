@@ -1,12 +1,99 @@
 """
 Contains asymmetry estimation functionality.
 """
-from typing import Dict
+from typing import Dict, List, Sequence, Union
 
 import numpy as np
 from lapy import shapedna
 
 
+# Define structures
+
+# combined and individual aseg labels:
+# - Left  Striatum: left  Caudate + Putamen + Accumbens
+# - Right Striatum: right Caudate + Putamen + Accumbens
+# - CorpusCallosum: 5 subregions combined
+# - Cerebellum: brainstem + (left+right) cerebellum WM and GM
+# - Ventricles: (left+right) lat.vent + inf.lat.vent + choroidplexus + 3rdVent + CSF
+# - Lateral-Ventricle: lat.vent + inf.lat.vent + choroidplexus
+# - 3rd-Ventricle: 3rd-Ventricle + CSF
+
+_STRUCTURES_LR = (
+    ("Left-Striatum", "Right-Striatum"),
+    ("Left-Lateral-Ventricle", "Right-Lateral-Ventricle"),
+    (
+        "Left-Cerebellum-White-Matter",
+        "Right-Cerebellum-White-Matter",
+    ),
+    ("Left-Cerebellum-Cortex", "Right-Cerebellum-Cortex"),
+    ("Left-Thalamus-Proper", "Right-Thalamus-Proper"),
+    ("Left-Caudate", "Right-Caudate"),
+    ("Left-Putamen", "Right-Putamen"),
+    ("Left-Pallidum", "Right-Pallidum"),
+    ("Left-Hippocampus", "Right-Hippocampus"),
+    ("Left-Amygdala", "Right-Amygdala"),
+    ("Left-Accumbens-area", "Right-Accumbens-area"),
+    ("Left-VentralDC", "Right-VentralDC"),
+)
+
+_CEREB_LR = (
+    #("Cbm_Left-Cerebellum-White-Matter", "Cbm_Right-Cerebellum-White-Matter"),
+    #("Cbm_Left-Cerebellum-Cortex", "Cbm_Right-Cerebellum-Cortex"),
+    ("Cbm_Left_I_IV", "Cbm_Right_I_IV"),
+    ("Cbm_Left_V", "Cbm_Right_V"),
+    ("Cbm_Left_VI", "Cbm_Right_VI"),
+    ("Cbm_Left_CrusI", "Cbm_Right_CrusI"),
+    ("Cbm_Left_CrusII", "Cbm_Right_CrusII"),
+    ("Cbm_Left_VIIb", "Cbm_Right_VIIb"),
+    ("Cbm_Left_VIIIa", "Cbm_Right_VIIIa"),
+    ("Cbm_Left_VIIIb", "Cbm_Right_VIIIb"),
+    ("Cbm_Left_IX", "Cbm_Right_IX"),
+    ("Cbm_Left_X", "Cbm_Right_X"),
+)
+
+_CORTEX_LR = (
+    ("lh-white-2d", "rh-white-2d"),
+    ("lh-pial-2d", "rh-pial-2d"),
+)
+
+# (skip_cortex, skip_cerebellum) to the lateral structure pairs to compare
+_STRUCTURES = {
+    (False, False): _STRUCTURES_LR + _CORTEX_LR + _CEREB_LR,
+    (False, True): _STRUCTURES_LR + _CORTEX_LR,
+    (True, False): _STRUCTURES_LR + _CEREB_LR,
+    (True, True): _STRUCTURES_LR,
+}
+
+
+def _stack_eigenvalues(
+    eigenvalues: Dict[str, Union[np.ndarray, List[str]]], labels: Sequence[str]
+) -> np.ndarray:
+    """
+    Stack the eigenvalues of several structures into a single array.
+
+    Area and volume are dropped and shorter rows are padded with NaNs.
+
+    Parameters
+    ----------
+    eigenvalues : Dict[str, Union[np.ndarray, List[str]]]
+        Surface label to area, volume and eigenvalues, as returned by
+        :func:`compute_brainprint`. Failed surfaces hold ``["NaN"] * (num + 2)``
+        string lists instead of arrays.
+    labels : Sequence[str]
+        Structure labels, one per row.
+
+    Returns
+    -------
+    np.ndarray
+        Eigenvalues array of shape (len(labels), max. number of eigenvalues).
+    """
+    rows = [np.asarray(eigenvalues[label][2:], dtype=float) for label in labels]
+    stacked = np.full((len(rows), max(len(row) for row in rows)), np.nan)
+    for i, row in enumerate(rows):
+        stacked[i, : len(row)] = row
+    return stacked
+
+
 def compute_asymmetry(
     eigenvalues, distance: str = "euc", skip_cortex: bool = False, skip_cerebellum: bool = False
 ) -> Dict[str, float]:
@@ -27,71 +114,15 @@ def compute_asymmetry(
     Dict[str, float]
         {left_label}_{right_label}, distance.
     """
-    # Define structures
-
-    # combined and individual aseg labels:
-    # - Left  Striatum: left  Caudate + Putamen + Accumbens
-    # - Right Striatum: right Caudate + Putamen + Accumbens
-    # - CorpusCallosum: 5 subregions combined
-    # - Cerebellum: brainstem + (left+right) cerebellum WM and GM
-    # - Ventricles: (left+right) lat.vent + inf.lat.vent + choroidplexus + 3rdVent + CSF
-    # - Lateral-Ventricle: lat.vent + inf.lat.vent + choroidplexus
-    # - 3rd-Ventricle: 3rd-Ventricle + CSF
-
-    structures_left_right = [
-        ("Left-Striatum", "Right-Striatum"),
-        ("Left-Lateral-Ventricle", "Right-Lateral-Ventricle"),
-        (
-            "Left-Cerebellum-White-Matter",
-            "Right-Cerebellum-White-Matter",
-        ),
-        ("Left-Cerebellum-Cortex", "Right-Cerebellum-Cortex"),
-        ("Left-Thalamus-Proper", "Right-Thalamus-Proper"),
-        ("Left-Caudate", "Right-Caudate"),
-        ("Left-Putamen", "Right-Putamen"),
-        ("Left-Pallidum", "Right-Pallidum"),
-        ("Left-Hippocampus", "Right-Hippocampus"),
-        ("Left-Amygdala", "Right-Amygdala"),
-        ("Left-Accumbens-area", "Right-Accumbens-area"),
-        ("Left-VentralDC", "Right-VentralDC"),
-    ]
-
-    structures_left_right_cerebellum = [
-        #("Cbm_Left-Cerebellum-White-Matter", "Cbm_Right-Cerebellum-White-Matter"),
-        #("Cbm_Left-Cerebellum-Cortex", "Cbm_Right-Cerebellum-Cortex"),
-        ("Cbm_Left_I_IV", "Cbm_Right_I_IV"),
-        ("Cbm_Left_V", "Cbm_Right_V"),
-        ("Cbm_Left_VI", "Cbm_Right_VI"),
-        ("Cbm_Left_CrusI", "Cbm_Right_CrusI"),
-        ("Cbm_Left_CrusII", "Cbm_Right_CrusII"),
-        ("Cbm_Left_VIIb", "Cbm_Right_VIIb"),
-        ("Cbm_Left_VIIIa", "Cbm_Right_VIIIa"),
-        ("Cbm_Left_VIIIb", "Cbm_Right_VIIIb"),
-        ("Cbm_Left_IX", "Cbm_Right_IX"),
-        ("Cbm_Left_X", "Cbm_Right_X"),
-    ]
-
-    cortex_2d_left_right = [
-        ("lh-white-2d", "rh-white-2d"),
-        ("lh-pial-2d", "rh-pial-2d"),
-    ]
-
-    structures = structures_left_right
-    if not skip_cortex:
-        structures += cortex_2d_left_right
-
-    if not skip_cerebellum:
-        structures += structures_left_right_cerebellum
-
-    distances = dict()
-    for left_label, right_label in structures:
-        left_eigenvalues, right_eigenvalues = (
-            eigenvalues[left_label][2:],
-            eigenvalues[right_label][2:],
-        )
-        has_nan = np.isnan(left_eigenvalues).any() or np.isnan(right_eigenvalues).any()
-        key = f"{left_label}_{right_label}"
-        if has_nan:
+    structures = _STRUCTURES[(bool(skip_cortex), bool(skip_cerebellum))]
+
+    left_labels, right_labels = zip(*structures)
+    left_eigenvalues = _stack_eigenvalues(eigenvalues, left_labels)
+    right_eigenvalues = _stack_eigenvalues(eigenvalues, right_labels)
+    has_nan = np.isnan(left_eigenvalues).any(axis=1)
+    has_nan |= np.isnan(right_eigenvalues).any(axis=1)
+    for (left_label, right_label), skip in zip(structures, has_nan):
+        if skip:
             message = (
                 "NaNs found for {left_label} or {right_label}, "
                 "skipping asymmetry computation...".format(
@@ -99,11 +130,26 @@ def compute_asymmetry(
                 )
             )
             print(message)
-            distances[key] = np.nan
-        else:
-            distances[key] = shapedna.compute_distance(
-                left_eigenvalues,
-                right_eigenvalues,
-                dist=distance,
-            )
-    return distances
+
+    if distance == "euc":
+        # all pairs at once instead of one shapedna call per pair; same
+        # reduction as shapedna.compute_distance, normalization is applied per
+        # mesh, as configured, in compute_brainprint
+        values = np.linalg.norm(left_eigenvalues - right_eigenvalues, axis=1)
+        values[has_nan] = np.nan
+    else:
+        values = np.array(
+            [
+                np.nan
+                if skip
+                else shapedna.compute_distance(left, right, dist=distance)
+                for left, right, skip in zip(
+                    left_eigenvalues, right_eigenvalues, has_nan
+                )
+            ]
+        )
+
+    return {
+        f"{left_label}_{right_label}": float(value)
+        for (left_label, right_label), value in zip(structures, values)
+    }
@@ -205,6 +205,7 @@ def run_brainprint(
     asymmetry_distance: str = "euc",
     keep_temp: bool = False,
     use_cholmod: bool = False,
+    surface_backend: str = "freesurfer",
 ):
     """
     Run the BrainPrint analysis.
@@ -241,6 +242,10 @@ def run_brainprint(
         If True, attempts to use the Cholesky decomposition for improved execution
         speed. Requires the ``scikit-sparse`` library. If it can not be found, an error
         will be thrown. If False, will use slower LU decomposition. This is the default.
+    surface_backend : str, optional
+        Surface extraction backend. "freesurfer" runs the FreeSurfer binaries,
+        "python" extracts surfaces in-process and requires the ``scikit-image``
+        library, by default "freesurfer".
 
     Returns
     -------
@@ -258,7 +263,14 @@ def run_brainprint(
         destination=destination,
     )
 
-    surfaces = create_surfaces(subject_dir, destination, skip_cortex=skip_cortex, skip_cerebellum=skip_cerebellum)
+    surfaces = create_surfaces(
+        subject_dir,
+        destination,
+        skip_cortex=skip_cortex,
+        skip_cerebellum=skip_cerebellum,
+        backend=surface_backend,
+        keep_temp=keep_temp,
+    )
     eigenvalues, eigenvectors = compute_brainprint(
         surfaces,
         num=num,
@@ -306,6 +318,7 @@ class Brainprint:
         environment_validation: bool = True,
         freesurfer_validation: bool = True,
         use_cholmod: bool = False,
+        surface_backend: str = "freesurfer",
     ) -> None:
         """
         Initializes a new :class:`Brainprint` instance.
@@ -339,6 +352,10 @@ class Brainprint:
             speed. Requires the ``scikit-sparse`` library. If it can not be found, an
             error will be thrown. If False, will use slower LU decomposition. This is
             the default.
+        surface_backend : str, optional
+            Surface extraction backend. "freesurfer" runs the FreeSurfer binaries,
+            "python" extracts surfaces in-process and requires the
+            ``scikit-image`` library, by default "freesurfer"
         """
         self.subjects_dir = subjects_dir
         self.num = num
@@ -351,6 +368,7 @@ class Brainprint:
         self.asymmetry_distance = asymmetry_distance
         self.keep_temp = keep_temp
         self.use_cholmod = use_cholmod
+        self.surface_backend = surface_backend
 
         self._subject_id = None
         self._destination = None
@@ -372,7 +390,12 @@ class Brainprint:
         )
 
         surfaces = create_surfaces(
-            subject_dir, destination, skip_cortex=self.skip_cortex, skip_cerebellum=self.skip_cerebellum
+            subject_dir,
+            destination,
+            skip_cortex=self.skip_cortex,
+            skip_cerebellum=self.skip_cerebellum,
+            backend=self.surface_backend,
+            keep_temp=self.keep_temp,
         )
         self._eigenvalues, self._eigenvectors = compute_brainprint(
             surfaces,
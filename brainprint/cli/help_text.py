@@ -22,6 +22,10 @@ ASYM_DISTANCE: str = (
     "Distance measurement to use for asymmetry calculation (default: euc)"
 )
 CHOLMOD: str = "Use cholesky decomposition (faster) instead of LU decomposition (slower). May require manual install of scikit-sparse library. Default is LU decomposition."
+SURFACE_BACKEND: str = (
+    "Surface extraction backend, either FreeSurfer binaries or in-process "
+    "marching cubes (requires scikit-image) (default: freesurfer)"
+)
 KEEP_TEMP: str = (
     "Whether to keep the temporary files directory or not, by default False"
 )
@@ -103,7 +107,8 @@ COMMAND-LINE USAGE
 
 python3 brainprint.py --sdir <directory> --sid <SubjectID>  [--num <num>]
                     [--evec] [--skipcortex] [--norm <surface|volume|geometry|none> ]
-                    [--reweight] [--asymmetry] [--cholmod] [--outdir <directory>] 
+                    [--reweight] [--asymmetry] [--cholmod]
+                    [--surface-backend <freesurfer|python>] [--outdir <directory>]
                     [--help] [--more-help]
 
 Options:
@@ -130,6 +135,10 @@ Processing directives:
     --cholmod        Use cholesky decomposition (faster) instead of LU 
                      decomposition (slower). May require manual install of the
                      scikit-sparse library. Default is LU decomposition.
+    --surface-backend <freesurfer|python>
+                     Extract surfaces with the FreeSurfer binaries (default) or
+                     in-process via marching cubes. The python backend requires
+                     the scikit-image library and does not apply mri_pretess.
 
 Output parameters:
     --outdir=OUTDIR  Output directory (default: <sdir>/<sid>/brainprint)
@@ -110,6 +110,15 @@ def parse_options():
         action="store_true",
         required=False,
     )
+    optional.add_argument(
+        "--surface-backend",
+        dest="surface_backend",
+        help=help_text.SURFACE_BACKEND,
+        default="freesurfer",
+        metavar="<freesurfer|python>",
+        choices=["freesurfer", "python"],
+        required=False,
+    )
 
     # Output options
     output = parser.add_argument_group(title="Output parameters")
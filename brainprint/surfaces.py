@@ -1,72 +1,505 @@
 """
 Utility module holding surface generation related functions.
 """
-import uuid
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
 
+import nibabel as nib
+import numpy as np
 from lapy import TriaMesh
 
 from .utils.utils import run_shell_command
 
+SURFACE_BACKENDS = ("freesurfer", "python")
 
-def create_cereb_surface(
-    subject_dir: Path, destination: Path, indices: List[int]
+# first FreeSurfer major version whose mri_mc writes *.vtk surfaces
+MRI_MC_VTK_VERSION = 7
+
+_SEGMENTATION_LOCK = threading.Lock()
+_MRI_MC_LOCK = threading.Lock()
+
+
+def _vox2ras_tkr(image: nib.spatialimages.SpatialImage) -> np.ndarray:
+    """
+    Compute FreeSurfer's tkregister voxel to surface RAS transform.
+
+    This is the space ``mri_mc`` writes surfaces in: the direction cosines and
+    voxel sizes of the image, centered on the middle of the volume. Unlike
+    :meth:`nibabel.freesurfer.mghformat.MGHHeader.get_vox2ras_tkr` it does not
+    assume a conformed (LIA) volume and also works for NIfTI images.
+
+    Parameters
+    ----------
+    image : nib.spatialimages.SpatialImage
+        Segmentation image.
+
+    Returns
+    -------
+    np.ndarray
+        4x4 voxel to surface RAS transform.
+    """
+    vox2ras = np.eye(4)
+    vox2ras[:3, :3] = image.affine[:3, :3]
+    vox2ras[:3, 3] = -vox2ras[:3, :3] @ (np.array(image.shape[:3]) / 2)
+    return vox2ras
+
+
+@lru_cache(maxsize=2)
+def _read_segmentation(path: str, mtime: int) -> Tuple[np.ndarray, np.ndarray]:
+    image = nib.load(path)
+    # labels are read in their on-disk type (never get_fdata's float64) and
+    # wider types are narrowed to the smallest one the labels fit, to cut
+    # memory traffic of the mask sweeps
+    volume = np.asanyarray(image.dataobj)
+    # labels index the lookup table of _encode_label_groups, negative values
+    # would silently wrap around to other labels
+    if volume.min() < 0:
+        message = "Segmentation {path} contains negative labels!".format(path=path)
+        raise ValueError(message)
+    if volume.dtype.kind in "iu" and volume.dtype.itemsize <= 2:
+        # MGH data is big-endian, swap once rather than in every sweep
+        volume = volume.astype(volume.dtype.newbyteorder("="), copy=False)
+    elif volume.max() <= np.iinfo(np.uint8).max:
+        volume = volume.astype(np.uint8)
+    elif volume.max() <= np.iinfo(np.int16).max:
+        volume = volume.astype(np.int16)
+    else:
+        volume = volume.astype(np.int32, copy=False)
+    # shared between all structures, so guard against accidental modification
+    volume.flags.writeable = False
+    return volume, _vox2ras_tkr(image)
+
+
+def _load_segmentation(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load a segmentation volume, reusing the last loaded volumes.
+
+    The cache is keyed on the path and modification time, so every structure
+    of a subject shares a single read of the segmentation file.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the segmentation volume.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Read-only label volume, voxel to surface RAS transform.
+
+    Raises
+    ------
+    ValueError
+        The segmentation contains negative labels
+    """
+    # serialize so concurrent surface jobs do not all miss the cache at once
+    with _SEGMENTATION_LOCK:
+        return _read_segmentation(str(path), Path(path).stat().st_mtime_ns)
+
+
+def _write_vtk(vertices: np.ndarray, triangles: np.ndarray, destination: Path) -> Path:
+    """
+    Write a triangle mesh as ASCII *.vtk*.
+
+    Produces the same layout as :meth:`lapy.TriaMesh.write_vtk`, but formats
+    all vertices and triangles at once rather than row by row. Coordinates are
+    written with float32 precision, which is what :meth:`lapy.TriaMesh.read_vtk`
+    reads back. The ASCII format is kept because that reader does not support
+    binary files.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertex coordinates, shape (n, 3).
+    triangles : np.ndarray
+        Vertex indices per triangle, shape (m, 3).
+    destination : Path
+        Path of the *.vtk* file to create.
+
+    Returns
+    -------
+    Path
+        Path of the written file.
+    """
+    n_vertices, n_triangles = len(vertices), len(triangles)
+    with open(destination, "w") as f:
+        f.write("# vtk DataFile Version 1.0\nvtk output\nASCII\nDATASET POLYDATA\n")
+        f.write(f"POINTS {n_vertices} float\n")
+        f.write(("%.9g %.9g %.9g\n" * n_vertices) % tuple(vertices.ravel().tolist()))
+        f.write(f"POLYGONS {n_triangles} {4 * n_triangles}\n")
+        f.write(("3 %d %d %d\n" * n_triangles) % tuple(triangles.ravel().tolist()))
+    return destination
+
+
+def _build_surface_from_mask(
+    mask: np.ndarray, vox2ras: np.ndarray, destination: Path
 ) -> Path:
-    
+    """
+    Triangulate a binary mask with marching cubes and write it as *.vtk*.
 
-    cerebseg_path = subject_dir / "mri/cerebellum.CerebNet.nii.gz"
-    norm_path = subject_dir / "mri/norm.mgz"
-    temp_name = "temp/cereb.{uid}".format(uid=uuid.uuid4())
-    indices_mask = destination / f"{temp_name}.mgz"
-    # binarize on selected labels (creates temp indices_mask)
-    # always binarize first, otherwise pretess may scale aseg if labels are
-    # larger than 255 (e.g. aseg+aparc, bug in mri_pretess?)
-    binarize_template = "mri_binarize --i {source} --match {match} --o {destination}"
-    binarize_command = binarize_template.format(
-        source=cerebseg_path, match=" ".join(indices), destination=indices_mask
+    Vertices are written in surface RAS coordinates, matching the surfaces
+    created by the FreeSurfer backend.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        Binary mask of the structure.
+    vox2ras : np.ndarray
+        Voxel to surface RAS transform of the mask.
+    destination : Path
+        Path of the *.vtk* file to create.
+
+    Returns
+    -------
+    Path
+        Path to the generated surface in VTK format.
+
+    Raises
+    ------
+    ImportError
+        The ``scikit-image`` library is not installed
+    """
+    try:
+        from skimage.measure import marching_cubes
+    except ImportError:
+        raise ImportError(
+            "The 'python' surface backend requires the scikit-image library."
+        )
+
+    # pad so structures touching the volume border still yield closed surfaces
+    mask = np.pad(mask, 1).astype(np.uint8)
+    vertices, faces, _, _ = marching_cubes(
+        mask,
+        level=0.5,
+        gradient_direction="ascent",
+        allow_degenerate=False,
     )
-    run_shell_command(binarize_command)
+    # undo the padding offset in voxel space before moving to surface RAS
+    vertices = nib.affines.apply_affine(vox2ras, vertices - 1)
+    # mirroring transforms (e.g. LIA) would otherwise turn normals inward
+    if np.linalg.det(vox2ras[:3, :3]) < 0:
+        faces = faces[:, ::-1]
+    return _write_vtk(vertices, faces, destination)
+
+
+def _create_mask_surface(
+    segmentation_path: Path, destination: Path, indices: List[str]
+) -> Path:
+    """
+    Extract the surface of the selected labels without calling FreeSurfer.
+
+    The segmentation is binarized and triangulated in-process using marching
+    cubes, and the resulting mesh is written directly to *destination*. Unlike
+    the FreeSurfer pipeline, no ``mri_pretess`` label fix is applied.
+
+    Parameters
+    ----------
+    segmentation_path : Path
+        Path to the segmentation volume.
+    destination : Path
+        Path of the *.vtk* file to create.
+    indices : List[str]
+        List of label indices to include in the surface generation.
+
+    Returns
+    -------
+    Path
+        Path to the generated surface in VTK format.
+
+    Raises
+    ------
+    RuntimeError
+        None of the selected labels are present in the segmentation
+    """
+    volume, vox2ras = _load_segmentation(segmentation_path)
+    mask = np.isin(volume, np.array(indices, dtype=np.int32))
+    if not mask.any():
+        message = "Labels {indices} not found in {path}!".format(
+            indices=" ".join(indices), path=segmentation_path
+        )
+        raise RuntimeError(message)
+    return _build_surface_from_mask(mask, vox2ras, destination)
+
+
+def _find_composite_groups(groups: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """
+    Find label groups that are the union of other, smaller groups.
+
+    For instance, "Cbm_Vermis" combines all "Cbm_Vermis_*" lobules.
+
+    Parameters
+    ----------
+    groups : Dict[str, List[str]]
+        Group name to label indices.
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        Composite group name to the names of the groups it is made of.
+    """
+    label_sets = {name: set(indices) for name, indices in groups.items()}
+    composites = {}
+    for name, labels in label_sets.items():
+        parts = [other for other, subset in label_sets.items() if subset < labels]
+        if len(parts) > 1 and set().union(*(label_sets[p] for p in parts)) == labels:
+            composites[name] = parts
+    return composites
+
+
+def _encode_label_groups(
+    volume: np.ndarray, groups: Dict[str, List[str]]
+) -> Dict[str, List[Tuple[np.ndarray, int]]]:
+    """
+    Encode the membership of every voxel in several label groups.
 
-    label_value = "1"
-    # if norm exist, fix label (pretess)
-    if norm_path.is_file():
-        pretess_template = (
-            "mri_pretess {source} {label_value} {norm_path} {destination}"
+    Rather than scanning the volume once per group, each group is assigned a
+    bit in a lookup table indexed by label, so a single sweep over the volume
+    encodes up to eight groups. Groups that are the union of other groups do
+    not get a bit of their own but reuse the bits of their parts.
+
+    Parameters
+    ----------
+    volume : np.ndarray
+        Label volume.
+    groups : Dict[str, List[str]]
+        Group name to label indices.
+
+    Returns
+    -------
+    Dict[str, List[Tuple[np.ndarray, int]]]
+        Group name to (encoded volume, group bits) pairs, the group's mask is
+        the union of the set bits over all pairs.
+    """
+    composites = _find_composite_groups(groups)
+    names = [name for name in groups if name not in composites]
+    size = int(volume.max()) + 1
+    encoded = {}
+    for start in range(0, len(names), 8):
+        batch = names[start : start + 8]
+        lut = np.zeros(size, dtype=np.uint8)
+        for bit, name in enumerate(batch):
+            indices = np.array(groups[name], dtype=np.intp)
+            lut[indices[indices < size]] |= 1 << bit
+        coded = lut[volume]
+        for bit, name in enumerate(batch):
+            encoded[name] = [(coded, 1 << bit)]
+
+    # parts are strictly smaller than their composite, so resolve small first
+    for name in sorted(composites, key=lambda name: len(groups[name])):
+        bits = {}
+        for part in composites[name]:
+            for coded, bit in encoded[part]:
+                bits[id(coded)] = (coded, bits.get(id(coded), (coded, 0))[1] | bit)
+        encoded[name] = list(bits.values())
+    return {name: encoded[name] for name in groups}
+
+
+def _create_encoded_surface(
+    encoded: List[Tuple[np.ndarray, int]],
+    vox2ras: np.ndarray,
+    destination: Path,
+    segmentation_path: Path,
+    indices: List[str],
+) -> Path:
+    mask = np.logical_or.reduce([(coded & bits) != 0 for coded, bits in encoded])
+    if not mask.any():
+        message = "Labels {indices} not found in {path}!".format(
+            indices=" ".join(indices), path=segmentation_path
+        )
+        raise RuntimeError(message)
+    return _build_surface_from_mask(mask, vox2ras, destination)
+
+
+def _mask_surface_jobs(
+    segmentation_path: Path,
+    destination: Path,
+    prefix: str,
+    groups: Dict[str, List[str]],
+) -> Dict[str, Tuple[Callable, tuple]]:
+    volume, vox2ras = _load_segmentation(segmentation_path)
+    encoded = _encode_label_groups(volume, groups)
+    jobs = {}
+    for label, indices in groups.items():
+        relative_path = "surfaces/{prefix}.final.{indices}.vtk".format(
+            prefix=prefix, indices="_".join(indices)
         )
-        pretess_command = pretess_template.format(
-            source=indices_mask,
-            label_value=label_value,
-            norm_path=norm_path,
-            destination=indices_mask,
+        jobs[label] = (
+            _create_encoded_surface,
+            (
+                encoded[label],
+                vox2ras,
+                destination / relative_path,
+                segmentation_path,
+                indices,
+            ),
         )
-        run_shell_command(pretess_command)
-
-    # runs marching cube to extract surface
-    surface_name = "{name}.surf".format(name=temp_name)
-    surface_path = destination / surface_name
-    extraction_template = "mri_mc {source} {label_value} {destination}"
-    extraction_command = extraction_template.format(
-        source=indices_mask, label_value=label_value, destination=surface_path
-    )
-    run_shell_command(extraction_command)
+    return jobs
+
+
+@lru_cache(maxsize=None)
+def _probe_mri_mc_vtk() -> bool:
+    try:
+        result = subprocess.run(
+            ["mri_mc", "--version"], capture_output=True, text=True, check=False
+        )
+    except OSError:
+        return False
+    # the release is the version field of the build stamp, e.g.
+    # "freesurfer-linux-centos7_x86_64-7.4.1-20230614-7eb8460" or
+    # "freesurfer-Linux-centos6_x86_64-stable-pub-v6.0.0-2beb96c"
+    match = re.search(r"-v?(\d+)\.\d+\.\d+-", result.stdout + result.stderr)
+    return match is not None and int(match.group(1)) >= MRI_MC_VTK_VERSION
+
+
+def _mri_mc_writes_vtk() -> bool:
+    """
+    Check whether ``mri_mc`` can write *.vtk* surfaces directly.
+
+    FreeSurfer picks the surface format from the output file extension, which
+    saves the ``mris_convert`` call per structure. Only releases from
+    ``MRI_MC_VTK_VERSION`` on are trusted with this; older or unrecognized
+    versions, detected once from ``mri_mc --version``, keep the conversion step.
+
+    Returns
+    -------
+    bool
+        Whether the installed FreeSurfer version writes *.vtk* from ``mri_mc``.
+    """
+    # serialize so concurrent surface jobs probe FreeSurfer only once
+    with _MRI_MC_LOCK:
+        return _probe_mri_mc_vtk()
+
+
+@lru_cache(maxsize=64)
+def _has_norm(subject_dir: str) -> bool:
+    # checked once per subject rather than once per structure, which matters
+    # on network file systems
+    return (Path(subject_dir) / "mri/norm.mgz").is_file()
+
+
+def _create_freesurfer_surface(
+    segmentation_path: Path,
+    subject_dir: Path,
+    destination: Path,
+    indices: List[str],
+    prefix: str,
+    conversion_destination: Path,
+    keep_temp: bool = False,
+) -> Path:
+    """
+    Extract the surface of the selected labels with the FreeSurfer binaries.
+
+    Parameters
+    ----------
+    segmentation_path : Path
+        Path to the segmentation volume.
+    subject_dir : Path
+        Path to the subject's directory.
+    destination : Path
+        Path to the destination directory where the surface will be saved.
+    indices : List[str]
+        List of label indices to include in the surface generation.
+    prefix : str
+        Prefix of the intermediate files.
+    conversion_destination : Path
+        Path of the *.vtk* file to create.
+    keep_temp : bool, optional
+        Whether to keep the intermediate files in *destination*/temp, by
+        default False.
+
+    Returns
+    -------
+    Path
+        Path to the generated surface in VTK format.
+    """
+    # intermediates live in a per-surface directory that is removed even if a
+    # FreeSurfer command fails, unless they are kept for inspection
+    temp_name = "{prefix}.{indices}.".format(prefix=prefix, indices="_".join(indices))
+    temp_dir = Path(tempfile.mkdtemp(prefix=temp_name, dir=destination / "temp"))
+    try:
+        norm_path = subject_dir / "mri/norm.mgz"
+        indices_mask = temp_dir / f"{prefix}.mgz"
+        # binarize on selected labels (creates temp indices_mask)
+        # always binarize first, otherwise pretess may scale aseg if labels are
+        # larger than 255 (e.g. aseg+aparc, bug in mri_pretess?)
+        run_shell_command(
+            [
+                "mri_binarize",
+                "--i",
+                segmentation_path,
+                "--match",
+                *indices,
+                "--o",
+                indices_mask,
+            ]
+        )
+
+        label_value = "1"
+        # if norm exist, fix label (pretess)
+        if _has_norm(str(subject_dir)):
+            run_shell_command(
+                ["mri_pretess", indices_mask, label_value, norm_path, indices_mask]
+            )
+
+        # runs marching cube to extract surface
+        if _mri_mc_writes_vtk():
+            run_shell_command(
+                ["mri_mc", indices_mask, label_value, conversion_destination]
+            )
+        else:
+            surface_path = temp_dir / f"{prefix}.surf"
+            run_shell_command(["mri_mc", indices_mask, label_value, surface_path])
 
-    # convert to vtk
+            # convert to vtk
+            run_shell_command(["mris_convert", surface_path, conversion_destination])
+    finally:
+        if not keep_temp:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    return conversion_destination
+
+
+def create_cereb_surface(
+    subject_dir: Path,
+    destination: Path,
+    indices: List[int],
+    backend: str = "freesurfer",
+    keep_temp: bool = False,
+) -> Path:
+    
+
+    cerebseg_path = subject_dir / "mri/cerebellum.CerebNet.nii.gz"
     relative_path = "surfaces/cereb.final.{indices}.vtk".format(
         indices="_".join(indices)
     )
     conversion_destination = destination / relative_path
-    conversion_template = "mris_convert {source} {destination}"
-    conversion_command = conversion_template.format(
-        source=surface_path, destination=conversion_destination
+    if backend == "python":
+        return _create_mask_surface(cerebseg_path, conversion_destination, indices)
+    return _create_freesurfer_surface(
+        cerebseg_path,
+        subject_dir,
+        destination,
+        indices,
+        "cereb",
+        conversion_destination,
+        keep_temp,
     )
-    run_shell_command(conversion_command)
-
-    return conversion_destination
 
 
 def create_aseg_surface(
-    subject_dir: Path, destination: Path, indices: List[int]
+    subject_dir: Path,
+    destination: Path,
+    indices: List[int],
+    backend: str = "freesurfer",
+    keep_temp: bool = False,
 ) -> Path:
     """
     Generate a surface from the aseg and label files.
@@ -79,6 +512,12 @@ def create_aseg_surface(
         Path to the destination directory where the surface will be saved.
     indices : List[int]
         List of label indices to include in the surface generation.
+    backend : str, optional
+        Surface extraction backend, either "freesurfer" or "python", by default
+        "freesurfer".
+    keep_temp : bool, optional
+        Whether to keep the intermediate files of the "freesurfer" backend in
+        *destination*/temp, by default False.
 
     Returns
     -------
@@ -86,59 +525,69 @@ def create_aseg_surface(
         Path to the generated surface in VTK format.
     """
     aseg_path = subject_dir / "mri/aseg.mgz"
-    norm_path = subject_dir / "mri/norm.mgz"
-    temp_name = "temp/aseg.{uid}".format(uid=uuid.uuid4())
-    indices_mask = destination / f"{temp_name}.mgz"
-    # binarize on selected labels (creates temp indices_mask)
-    # always binarize first, otherwise pretess may scale aseg if labels are
-    # larger than 255 (e.g. aseg+aparc, bug in mri_pretess?)
-    binarize_template = "mri_binarize --i {source} --match {match} --o {destination}"
-    binarize_command = binarize_template.format(
-        source=aseg_path, match=" ".join(indices), destination=indices_mask
-    )
-    run_shell_command(binarize_command)
-
-    label_value = "1"
-    # if norm exist, fix label (pretess)
-    if norm_path.is_file():
-        pretess_template = (
-            "mri_pretess {source} {label_value} {norm_path} {destination}"
-        )
-        pretess_command = pretess_template.format(
-            source=indices_mask,
-            label_value=label_value,
-            norm_path=norm_path,
-            destination=indices_mask,
-        )
-        run_shell_command(pretess_command)
-
-    # runs marching cube to extract surface
-    surface_name = "{name}.surf".format(name=temp_name)
-    surface_path = destination / surface_name
-    extraction_template = "mri_mc {source} {label_value} {destination}"
-    extraction_command = extraction_template.format(
-        source=indices_mask, label_value=label_value, destination=surface_path
-    )
-    run_shell_command(extraction_command)
-
-    # convert to vtk
     relative_path = "surfaces/aseg.final.{indices}.vtk".format(
         indices="_".join(indices)
     )
     conversion_destination = destination / relative_path
-    conversion_template = "mris_convert {source} {destination}"
-    conversion_command = conversion_template.format(
-        source=surface_path, destination=conversion_destination
+    if backend == "python":
+        return _create_mask_surface(aseg_path, conversion_destination, indices)
+    return _create_freesurfer_surface(
+        aseg_path,
+        subject_dir,
+        destination,
+        indices,
+        "aseg",
+        conversion_destination,
+        keep_temp,
     )
-    run_shell_command(conversion_command)
 
-    return conversion_destination
+
+def _run_surface_jobs(jobs: Dict[str, Tuple[Callable, tuple]]) -> Dict[str, Path]:
+    """
+    Run independent surface generation jobs concurrently.
+
+    The heavy lifting happens in FreeSurfer subprocesses, so a thread pool is
+    sufficient to keep all cores busy.
+
+    Parameters
+    ----------
+    jobs : Dict[str, Tuple[Callable, tuple]]
+        Surface label to (function, arguments) pairs.
+
+    Returns
+    -------
+    Dict[str, Path]
+        Surface label to generated surface path, in the order of *jobs*.
+    """
+    if not jobs:
+        return {}
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    surfaces = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(function, *arguments): label
+            for label, (function, arguments) in jobs.items()
+        }
+        try:
+            for future in as_completed(futures):
+                surfaces[futures[future]] = future.result()
+        except BaseException:
+            # fail fast as the sequential loop did: drop the queued jobs so
+            # the pool shutdown only waits for the ones already running
+            for pending in futures:
+                pending.cancel()
+            raise
+    return {label: surfaces[label] for label in jobs}
 
 
 ## Add functionality for cerebellum 
 
-def create_cereb_surfaces(subject_dir: Path, destination: Path) -> Dict[str, Path]:
-   
+def _cereb_surface_jobs(
+    subject_dir: Path,
+    destination: Path,
+    backend: str = "freesurfer",
+    keep_temp: bool = False,
+) -> Dict[str, Tuple[Callable, tuple]]:
     cereb_labels = {
         #'Cbm_Left-Cerebellum-White-Matter': ['7'],
         #'Cbm_Left-Cerebellum-Cortex': ['8'],
@@ -172,14 +621,39 @@ def create_cereb_surfaces(subject_dir: Path, destination: Path) -> Dict[str, Pat
         'Cbm_Vermis': ['631', '630', '627', '624', '606'],
     }
 
+    if backend == "python":
+        return _mask_surface_jobs(
+            subject_dir / "mri/cerebellum.CerebNet.nii.gz",
+            destination,
+            "cereb",
+            cereb_labels,
+        )
     return {
-        label: create_cereb_surface(subject_dir, destination, indices)
+        label: (
+            create_cereb_surface,
+            (subject_dir, destination, indices, backend, keep_temp),
+        )
         for label, indices in cereb_labels.items()
     }
 
 
+def create_cereb_surfaces(
+    subject_dir: Path,
+    destination: Path,
+    backend: str = "freesurfer",
+    keep_temp: bool = False,
+) -> Dict[str, Path]:
+    return _run_surface_jobs(
+        _cereb_surface_jobs(subject_dir, destination, backend, keep_temp)
+    )
 
-def create_aseg_surfaces(subject_dir: Path, destination: Path) -> Dict[str, Path]:
+
+def _aseg_surface_jobs(
+    subject_dir: Path,
+    destination: Path,
+    backend: str = "freesurfer",
+    keep_temp: bool = False,
+) -> Dict[str, Tuple[Callable, tuple]]:
     # Define aseg labels
 
     # combined and individual aseg labels:
@@ -223,13 +697,33 @@ def create_aseg_surfaces(subject_dir: Path, destination: Path) -> Dict[str, Path
         "Right-Accumbens-area": ["58"],
         "Right-VentralDC": ["60"],
     }
+    if backend == "python":
+        return _mask_surface_jobs(
+            subject_dir / "mri/aseg.mgz", destination, "aseg", aseg_labels
+        )
     return {
-        label: create_aseg_surface(subject_dir, destination, indices)
+        label: (
+            create_aseg_surface,
+            (subject_dir, destination, indices, backend, keep_temp),
+        )
         for label, indices in aseg_labels.items()
     }
 
 
-def create_cortical_surfaces(subject_dir: Path, destination: Path) -> Dict[str, Path]:
+def create_aseg_surfaces(
+    subject_dir: Path,
+    destination: Path,
+    backend: str = "freesurfer",
+    keep_temp: bool = False,
+) -> Dict[str, Path]:
+    return _run_surface_jobs(
+        _aseg_surface_jobs(subject_dir, destination, backend, keep_temp)
+    )
+
+
+def _cortical_surface_jobs(
+    subject_dir: Path, destination: Path
+) -> Dict[str, Tuple[Callable, tuple]]:
     cortical_labels = {
         "lh-white-2d": "lh.white",
         "rh-white-2d": "rh.white",
@@ -237,24 +731,41 @@ def create_cortical_surfaces(subject_dir: Path, destination: Path) -> Dict[str,
         "rh-pial-2d": "rh.pial",
     }
     return {
-        label: surf_to_vtk(
-            subject_dir / "surf" / name,
-            destination / "surfaces" / f"{name}.vtk",
+        label: (
+            surf_to_vtk,
+            (
+                subject_dir / "surf" / name,
+                destination / "surfaces" / f"{name}.vtk",
+            ),
         )
         for label, name in cortical_labels.items()
     }
 
 
+def create_cortical_surfaces(subject_dir: Path, destination: Path) -> Dict[str, Path]:
+    return _run_surface_jobs(_cortical_surface_jobs(subject_dir, destination))
+
+
 def create_surfaces(
-    subject_dir: Path, destination: Path, skip_cortex: bool = False, skip_cerebellum: bool = False
+    subject_dir: Path,
+    destination: Path,
+    skip_cortex: bool = False,
+    skip_cerebellum: bool = False,
+    backend: str = "freesurfer",
+    keep_temp: bool = False,
 ) -> Dict[str, Path]:
-    surfaces = create_aseg_surfaces(subject_dir, destination)
+    if backend not in SURFACE_BACKENDS:
+        message = "Invalid surface backend {backend}, expected one of {choices}!"
+        raise ValueError(
+            message.format(backend=backend, choices=", ".join(SURFACE_BACKENDS))
+        )
+    # all structures are independent, so share a single pool across groups
+    jobs = _aseg_surface_jobs(subject_dir, destination, backend, keep_temp)
     if not skip_cerebellum:
-        surfaces.update(create_cereb_surfaces(subject_dir, destination))
+        jobs.update(_cereb_surface_jobs(subject_dir, destination, backend, keep_temp))
     if not skip_cortex:
-        cortical_surfaces = create_cortical_surfaces(subject_dir, destination)
-        surfaces.update(cortical_surfaces)
-    return surfaces
+        jobs.update(_cortical_surface_jobs(subject_dir, destination))
+    return _run_surface_jobs(jobs)
 
 
 def read_vtk(path: Path):
@@ -290,5 +801,5 @@ def surf_to_vtk(source: Path, destination: Path) -> Path:
     Path
         Resulting *.vtk* file.
     """
-    TriaMesh.read_fssurf(source).write_vtk(destination)
-    return destination
+    triangular_mesh = TriaMesh.read_fssurf(source)
+    return _write_vtk(triangular_mesh.v, triangular_mesh.t, destination)
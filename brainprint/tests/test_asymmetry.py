@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from lapy import shapedna
+
+from ..asymmetry import compute_asymmetry
+
+
+def test_compute_asymmetry():
+    """Test lateral distances match the per-pair ShapeDNA distance."""
+    rng = np.random.default_rng(42)
+    labels = [
+        "Left-Striatum",
+        "Right-Striatum",
+        "Left-Lateral-Ventricle",
+        "Right-Lateral-Ventricle",
+        "Left-Cerebellum-White-Matter",
+        "Right-Cerebellum-White-Matter",
+        "Left-Cerebellum-Cortex",
+        "Right-Cerebellum-Cortex",
+        "Left-Thalamus-Proper",
+        "Right-Thalamus-Proper",
+        "Left-Caudate",
+        "Right-Caudate",
+        "Left-Putamen",
+        "Right-Putamen",
+        "Left-Pallidum",
+        "Right-Pallidum",
+        "Left-Hippocampus",
+        "Right-Hippocampus",
+        "Left-Amygdala",
+        "Right-Amygdala",
+        "Left-Accumbens-area",
+        "Right-Accumbens-area",
+        "Left-VentralDC",
+        "Right-VentralDC",
+    ]
+    eigenvalues = {label: np.sort(rng.random(12)) for label in labels}
+    eigenvalues["Right-Pallidum"] = ["NaN"] * 12
+
+    distances = compute_asymmetry(eigenvalues, skip_cortex=True, skip_cerebellum=True)
+    assert len(distances) == len(labels) // 2
+    assert np.isnan(distances["Left-Pallidum_Right-Pallidum"])
+    expected = shapedna.compute_distance(
+        eigenvalues["Left-Hippocampus"][2:], eigenvalues["Right-Hippocampus"][2:]
+    )
+    assert distances["Left-Hippocampus_Right-Hippocampus"] == pytest.approx(expected)
@@ -0,0 +1,256 @@
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import nibabel as nib
+import numpy as np
+import pytest
+
+from .. import surfaces
+from ..surfaces import (
+    _aseg_surface_jobs,
+    _create_freesurfer_surface,
+    _encode_label_groups,
+    _find_composite_groups,
+    _load_segmentation,
+    _probe_mri_mc_vtk,
+    _run_surface_jobs,
+    create_aseg_surface,
+    read_vtk,
+)
+
+
+@pytest.fixture
+def subject_dir(tmp_path):
+    """Create a subject directory holding a synthetic two-label aseg."""
+    x, y, z = np.mgrid[:32, :32, :32]
+    volume = np.zeros((32, 32, 32), dtype=np.int32)
+    volume[(x - 10) ** 2 + (y - 16) ** 2 + (z - 16) ** 2 < 36] = 17
+    volume[(x - 22) ** 2 + (y - 16) ** 2 + (z - 16) ** 2 < 36] = 53
+    (tmp_path / "mri").mkdir()
+    image = nib.MGHImage(volume, np.eye(4, dtype=np.float32))
+    nib.save(image, tmp_path / "mri" / "aseg.mgz")
+    (tmp_path / "brainprint" / "surfaces").mkdir(parents=True)
+    return tmp_path
+
+
+def test_create_aseg_surface_python(subject_dir):
+    """Test in-process surface extraction."""
+    pytest.importorskip("skimage")
+    destination = subject_dir / "brainprint"
+    path = create_aseg_surface(subject_dir, destination, ["17"], backend="python")
+    assert path == destination / "surfaces" / "aseg.final.17.vtk"
+    mesh = read_vtk(path)
+    assert mesh.is_closed()
+    assert mesh.is_manifold()
+    # outward orientation and roughly the voxelized volume
+    aseg = np.asanyarray(nib.load(subject_dir / "mri" / "aseg.mgz").dataobj)
+    assert mesh.volume() == pytest.approx(np.count_nonzero(aseg == 17), rel=0.2)
+
+    path = create_aseg_surface(
+        subject_dir, destination, ["17", "53"], backend="python"
+    )
+    assert read_vtk(path).volume() == pytest.approx(2 * mesh.volume(), rel=1e-3)
+
+    with pytest.raises(RuntimeError, match="not found"):
+        create_aseg_surface(subject_dir, destination, ["42"], backend="python")
+
+
+def test_create_aseg_surfaces_python(subject_dir):
+    """Test all aseg structures are extracted from a single encoded sweep."""
+    pytest.importorskip("skimage")
+    destination = subject_dir / "brainprint"
+    jobs = _aseg_surface_jobs(subject_dir, destination, backend="python")
+    present = {
+        label: job for label, job in jobs.items() if label.endswith("Hippocampus")
+    }
+    surfaces = _run_surface_jobs(present)
+    assert list(surfaces) == ["Left-Hippocampus", "Right-Hippocampus"]
+    # single structure extraction overwrites the same file with the same mesh
+    left = read_vtk(surfaces["Left-Hippocampus"])
+    path = create_aseg_surface(subject_dir, destination, ["17"], backend="python")
+    assert path == surfaces["Left-Hippocampus"]
+    assert np.allclose(left.v, read_vtk(path).v)
+
+    with pytest.raises(RuntimeError, match="not found"):
+        _run_surface_jobs({"Left-Amygdala": jobs["Left-Amygdala"]})
+
+
+def test_encode_label_groups():
+    """Test composite label groups reuse the bits of their parts."""
+    volume = np.array([[0, 1, 2], [3, 2, 1]], dtype=np.int16)
+    groups = {"a": ["1"], "ab": ["1", "2"], "b": ["2"], "c": ["3", "9"]}
+    assert _find_composite_groups(groups) == {"ab": ["a", "b"]}
+    encoded = _encode_label_groups(volume, groups)
+    for name, indices in groups.items():
+        pairs = encoded[name]
+        mask = np.logical_or.reduce([(coded & bits) != 0 for coded, bits in pairs])
+        assert np.array_equal(mask, np.isin(volume, np.array(indices, dtype=int)))
+    # three groups fit in a single sweep
+    assert len({id(coded) for pairs in encoded.values() for coded, _ in pairs}) == 1
+
+
+def test_create_aseg_surface_python_affine(tmp_path):
+    """Test python backend surfaces are in FreeSurfer's surface RAS space."""
+    pytest.importorskip("skimage")
+    volume = np.zeros((16, 16, 16), dtype=np.int32)
+    volume[4:8, 4:8, 4:8] = 17
+    # conformed (LIA) orientation with 2 mm voxels, mirrors the voxel axes
+    affine = np.array(
+        [[-2, 0, 0, 30], [0, 0, 2, -10], [0, -2, 0, 20], [0, 0, 0, 1]],
+        dtype=np.float32,
+    )
+    (tmp_path / "mri").mkdir()
+    image = nib.MGHImage(volume, affine)
+    nib.save(image, tmp_path / "mri" / "aseg.mgz")
+    destination = tmp_path / "brainprint"
+    (destination / "surfaces").mkdir(parents=True)
+
+    path = create_aseg_surface(tmp_path, destination, ["17"], backend="python")
+    mesh = read_vtk(path)
+    # the label boundary lies half a voxel outside the labelled voxel centers
+    corners = nib.affines.apply_affine(
+        image.header.get_vox2ras_tkr(), [[3.5, 3.5, 3.5], [7.5, 7.5, 7.5]]
+    )
+    assert np.allclose(mesh.v.min(axis=0), corners.min(axis=0))
+    assert np.allclose(mesh.v.max(axis=0), corners.max(axis=0))
+    # outward orientation despite the mirroring transform
+    assert mesh.volume() == pytest.approx(4**3 * 2**3, rel=0.2)
+
+
+def test_create_aseg_surface_python_negative_labels(tmp_path):
+    """Test segmentations with negative labels are rejected."""
+    volume = np.zeros((8, 8, 8), dtype=np.int32)
+    volume[2:4, 2:4, 2:4] = 17
+    volume[0, 0, 0] = -1
+    (tmp_path / "mri").mkdir()
+    image = nib.MGHImage(volume, np.eye(4, dtype=np.float32))
+    nib.save(image, tmp_path / "mri" / "aseg.mgz")
+    with pytest.raises(ValueError, match="negative labels"):
+        create_aseg_surface(tmp_path, tmp_path, ["17"], backend="python")
+
+
+@pytest.mark.parametrize(
+    "output,expected",
+    [
+        ("freesurfer-linux-centos7_x86_64-7.4.1-20230614-7eb8460\n", True),
+        ("freesurfer-linux-centos8_x86_64-7.1.1-20200723-8b40551\n", True),
+        ("freesurfer-Linux-centos6_x86_64-stable-pub-v6.0.0-2beb96c\n", False),
+        ("$Id: mri_mc.c,v 1.22 2011/03/02 00:04:15 nicks Exp $\n", False),
+    ],
+)
+def test_probe_mri_mc_vtk(monkeypatch, output, expected):
+    """Test the FreeSurfer release is read from the build stamp."""
+
+    def run(command, **kwargs):
+        return subprocess.CompletedProcess(command, 0, stdout=output, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    _probe_mri_mc_vtk.cache_clear()
+    try:
+        assert _probe_mri_mc_vtk() is expected
+    finally:
+        _probe_mri_mc_vtk.cache_clear()
+
+
+def test_probe_mri_mc_vtk_missing(monkeypatch):
+    """Test a missing ``mri_mc`` falls back to the conversion step."""
+
+    def run(command, **kwargs):
+        raise FileNotFoundError(command[0])
+
+    monkeypatch.setattr(subprocess, "run", run)
+    _probe_mri_mc_vtk.cache_clear()
+    try:
+        assert _probe_mri_mc_vtk() is False
+    finally:
+        _probe_mri_mc_vtk.cache_clear()
+
+
+def test_run_surface_jobs_fails_fast(monkeypatch):
+    """Test queued jobs are dropped once a job fails."""
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    finished = []
+
+    def fail():
+        raise RuntimeError("failed")
+
+    def slow(label):
+        time.sleep(0.05)
+        finished.append(label)
+        return label
+
+    jobs = {"fail": (fail, ())}
+    jobs.update({str(i): (slow, (str(i),)) for i in range(40)})
+    with pytest.raises(RuntimeError, match="failed"):
+        _run_surface_jobs(jobs)
+    # only the jobs already running when the failure surfaced may complete
+    assert len(finished) <= 2
+
+
+@pytest.mark.parametrize(
+    "dtype,maximum,expected",
+    [
+        (np.uint8, 17, np.uint8),
+        (np.int16, 17, np.int16),
+        (np.int32, 17, np.uint8),
+        (np.int32, 601, np.int16),
+        (np.int32, 40000, np.int32),
+        (np.float32, 601, np.int16),
+    ],
+)
+def test_load_segmentation_dtype(tmp_path, dtype, maximum, expected):
+    """Test narrow label types are kept and wider ones are narrowed."""
+    volume = np.zeros((8, 8, 8), dtype=dtype)
+    volume[2:4, 2:4, 2:4] = maximum
+    path = tmp_path / "aseg.mgz"
+    nib.save(nib.MGHImage(volume, np.eye(4, dtype=np.float32)), path)
+    labels, _ = _load_segmentation(path)
+    assert labels.dtype == expected
+    assert labels.max() == maximum
+    assert not labels.flags.writeable
+
+
+@pytest.mark.parametrize("keep_temp", [False, True])
+@pytest.mark.parametrize("fail", [False, True])
+def test_create_freesurfer_surface_keep_temp(tmp_path, monkeypatch, keep_temp, fail):
+    """Test the intermediates directory is only kept when requested."""
+    commands = []
+
+    def run_shell_command(command):
+        commands.append(command[0])
+        if fail and command[0] == "mri_mc":
+            raise RuntimeError("mri_mc failed")
+        Path(command[-1]).touch()
+
+    monkeypatch.setattr(surfaces, "run_shell_command", run_shell_command)
+    monkeypatch.setattr(surfaces, "_mri_mc_writes_vtk", lambda: False)
+    destination = tmp_path / "brainprint"
+    (destination / "temp").mkdir(parents=True)
+    (destination / "surfaces").mkdir()
+    conversion_destination = destination / "surfaces" / "aseg.final.17.vtk"
+    arguments = (
+        tmp_path / "mri" / "aseg.mgz",
+        tmp_path,
+        destination,
+        ["17"],
+        "aseg",
+        conversion_destination,
+    )
+
+    if fail:
+        with pytest.raises(RuntimeError, match="mri_mc failed"):
+            _create_freesurfer_surface(*arguments, keep_temp=keep_temp)
+    else:
+        path = _create_freesurfer_surface(*arguments, keep_temp=keep_temp)
+        assert path == conversion_destination
+        assert path.is_file()
+        assert commands == ["mri_binarize", "mri_mc", "mris_convert"]
+    temp_dirs = list((destination / "temp").iterdir())
+    if keep_temp:
+        assert len(temp_dirs) == 1
+        assert temp_dirs[0].name.startswith("aseg.17.")
+        assert (temp_dirs[0] / "aseg.mgz").is_file()
+    else:
+        assert temp_dirs == []
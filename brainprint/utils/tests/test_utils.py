@@ -0,0 +1,21 @@
+import sys
+
+import pytest
+
+from ..utils import run_shell_command
+
+
+def test_run_shell_command_list(tmp_path):
+    """Test list arguments keep paths containing spaces intact."""
+    target = tmp_path / "with space" / "x y"
+    target.parent.mkdir()
+    script = "import sys; open(sys.argv[1], 'w').write('ok')"
+    run_shell_command([sys.executable, "-c", script, target])
+    assert target.read_text() == "ok"
+    assert list(target.parent.iterdir()) == [target]
+
+
+def test_run_shell_command_failure():
+    """Test a non-zero exit code raises a RuntimeError."""
+    with pytest.raises(RuntimeError, match="non-zero exit code"):
+        run_shell_command([sys.executable, "-c", "raise SystemExit(1)"])
@@ -5,7 +5,7 @@ import os
 import shlex
 import subprocess
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Union
 
 import numpy as np
 import pandas as pd
@@ -31,7 +31,7 @@ def test_freesurfer() -> None:
     RuntimeError
         Failed to execute test FreeSurfer command
     """
-    command = "mri_binarize -version"
+    command = ["mri_binarize", "-version"]
     try:
         run_shell_command(command)
     except FileNotFoundError:
@@ -41,23 +41,32 @@ def test_freesurfer() -> None:
         )
 
 
-def run_shell_command(command: str, verbose: bool = False):
+def run_shell_command(command: Union[str, List], verbose: bool = False):
     """
     Execute shell command.
 
+    The command is executed directly, without spawning a shell. Passing the
+    arguments as a list is preferred, as it keeps paths containing spaces
+    intact.
+
     Parameters
     ----------
-    command : str
-        Shell command to be executed
+    command : Union[str, List]
+        Shell command to be executed, either as a string or as a list of
+        arguments (converted with :class:`str`)
 
     Raises
     ------
     RuntimeError
         Shell command execution failure
     """
+    if isinstance(command, str):
+        args = shlex.split(command)
+    else:
+        args = [str(arg) for arg in command]
+        command = shlex.join(args)
     if verbose:
         print(f"Executing command:\t{command}", end="\n")
-    args = shlex.split(command)
     try:
         return_code = subprocess.call(args)
     except Exception as e: